@@ -1,5 +1,7 @@
 """Simple configuration for the Iris Classification API."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -24,3 +26,9 @@ class Settings(BaseSettings):
     log_predictions: bool = Field(default=True, env="LOG_PREDICTIONS")
 
     model_config = {"env_file": ".env"}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached application settings (call cache_clear() to reload)."""
+    return Settings()
@@ -7,14 +7,15 @@ import asyncio
 import json
 import logging
 import sqlite3
-from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Tables created by LoggingService; count() only accepts these names
+LOG_TABLES = ("prediction_logs", "system_events", "api_metrics")
+
 
 class LoggingService:
     """
@@ -44,6 +45,13 @@ class LoggingService:
                 self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
                 self.connection.row_factory = sqlite3.Row  # Enable dict-like access
 
+                # WAL lets readers (monitoring, tests) run alongside prediction writes
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
+                self.connection.execute("PRAGMA busy_timeout=2000")
+                self.connection.execute("PRAGMA temp_store=MEMORY")
+                self.connection.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+
                 # Create tables
                 await self._create_tables()
                 logger.info(f"Database initialized: {self.db_path}")
@@ -74,6 +82,14 @@ class LoggingService:
         """
         )
 
+        # Stats and recent-prediction queries filter and sort on timestamp
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_prediction_logs_timestamp
+            ON prediction_logs(timestamp DESC)
+        """
+        )
+
         # System events table
         cursor.execute(
             """
@@ -151,34 +167,36 @@ class LoggingService:
 
         try:
             async with self._lock:
-                cursor = self.connection.cursor()
-
-                # Log each prediction in the batch
-                for i, prediction_result in enumerate(
-                    batch_result.get("predictions", [])
-                ):
-                    individual_request = (
-                        request_data[i] if i < len(request_data) else {}
+                predictions = batch_result.get("predictions", [])
+                processing_time_ms = batch_result.get(
+                    "total_processing_time_ms", 0.0
+                ) / max(len(predictions), 1)
+                batch_size = batch_result.get("batch_size", 1)
+
+                # Log each prediction in the batch with one prepared statement
+                rows = [
+                    (
+                        json.dumps(request_data[i] if i < len(request_data) else {}),
+                        prediction_result.get("prediction", ""),
+                        json.dumps(prediction_result.get("probabilities", {})),
+                        prediction_result.get("confidence", 0.0),
+                        prediction_result.get("model_version", "unknown"),
+                        processing_time_ms,
+                        batch_size,
                     )
+                    for i, prediction_result in enumerate(predictions)
+                ]
 
-                    cursor.execute(
-                        """
-                        INSERT INTO prediction_logs 
-                        (request_data, prediction, probabilities, confidence, model_version, 
-                         processing_time_ms, batch_size)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            json.dumps(individual_request),
-                            prediction_result.get("prediction", ""),
-                            json.dumps(prediction_result.get("probabilities", {})),
-                            prediction_result.get("confidence", 0.0),
-                            prediction_result.get("model_version", "unknown"),
-                            batch_result.get("total_processing_time_ms", 0.0)
-                            / len(batch_result.get("predictions", [1])),
-                            batch_result.get("batch_size", 1),
-                        ),
-                    )
+                cursor = self.connection.cursor()
+                cursor.executemany(
+                    """
+                    INSERT INTO prediction_logs 
+                    (request_data, prediction, probabilities, confidence, model_version, 
+                     processing_time_ms, batch_size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
 
                 self.connection.commit()
                 logger.debug(
@@ -327,6 +345,21 @@ class LoggingService:
             logger.error(f"Failed to get recent predictions: {e}")
             return []
 
+    async def count(self, table: str) -> int:
+        """Get the number of rows in one of the log tables"""
+        if table not in LOG_TABLES:
+            raise ValueError(f"Unknown log table: {table}")
+
+        try:
+            async with self._lock:
+                cursor = self.connection.cursor()
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                return cursor.fetchone()[0]
+
+        except Exception as e:
+            logger.error(f"Failed to count rows in {table}: {e}")
+            return 0
+
     async def is_healthy(self) -> bool:
         """Check if the logging service is healthy"""
         try:
@@ -5,21 +5,22 @@ and monitoring metrics following MLOps best practices.
 """
 
 import logging
-import os
+import subprocess
+import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict
+from pathlib import Path
+from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from .config import Settings
+from .config import get_settings
 from .logging_service import LoggingService
 from .metrics import metrics_collector
 from .models import (BatchPredictionRequest, BatchPredictionResponse,
-                     HealthResponse, ModelInfoResponse, PredictionRequest,
-                     PredictionResponse)
+                     ModelInfoResponse, PredictionRequest, PredictionResponse)
 from .prediction_service import PredictionService
 
 # Configure logging
@@ -48,7 +49,7 @@ async def lifespan(app: FastAPI):
 
     try:
         # Initialize configuration
-        settings = Settings()
+        settings = get_settings()
 
         # Initialize services
         prediction_service = PredictionService(settings)
@@ -135,6 +136,7 @@ async def predict(request: "PredictionRequest") -> "PredictionResponse":
             prediction=result.get("prediction", "unknown"),
             confidence=result.get("confidence", 0.0),
             duration=result.get("processing_time_ms", 0.0),
+            cache_hit=result.get("cache_hit", False),
         )
 
         # Log the prediction if logging service is available
@@ -142,8 +144,6 @@ async def predict(request: "PredictionRequest") -> "PredictionResponse":
             await logging_service.log_prediction(request.model_dump(), result)
 
         # Return formatted response
-        from .models import PredictionResponse
-
         return PredictionResponse(**result)
 
     except Exception as e:
@@ -165,9 +165,7 @@ async def predict_batch(request: "BatchPredictionRequest") -> "BatchPredictionRe
 
     try:
         # Convert all samples to numpy array
-        import numpy as np
-
-        features_batch = np.vstack([sample.to_array() for sample in request.samples])
+        features_batch = request.to_array()
 
         # Make batch prediction
         result = await prediction_service.predict_batch(features_batch)
@@ -188,8 +186,6 @@ async def predict_batch(request: "BatchPredictionRequest") -> "BatchPredictionRe
             )
 
         # Return formatted response
-        from .models import BatchPredictionResponse, PredictionResponse
-
         formatted_predictions = [
             PredictionResponse(**pred) for pred in result["predictions"]
         ]
@@ -222,8 +218,6 @@ async def get_model_info() -> "ModelInfoResponse":
     try:
         model_info = prediction_service.get_model_info()
 
-        from .models import ModelInfoResponse
-
         return ModelInfoResponse(
             model_name=model_info.get("model_name", "unknown"),
             model_version=model_info.get("model_version", "unknown"),
@@ -285,11 +279,24 @@ async def health_check():
         }
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison, lists and "*") against an ETag"""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/metrics")
-async def get_metrics():
+async def get_metrics(request: Request):
     """
     Prometheus metrics endpoint.
     Returns metrics in Prometheus text format for scraping.
+    Honors If-None-Match so unchanged payloads are answered with 304.
     """
     try:
         # Update system metrics before returning
@@ -300,8 +307,19 @@ async def get_metrics():
 
         # Return metrics in Prometheus format
         metrics_data = metrics_collector.get_metrics()
+        etag = metrics_collector.get_metrics_etag()
+        if etag is None:
+            return Response(
+                content=metrics_data, media_type=metrics_collector.get_content_type()
+            )
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
         return Response(
-            content=metrics_data, media_type=metrics_collector.get_content_type()
+            content=metrics_data,
+            media_type=metrics_collector.get_content_type(),
+            headers={"ETag": etag},
         )
 
     except Exception as e:
@@ -320,11 +338,6 @@ async def retrain_models():
     try:
         logger.info("Starting model retraining...")
         
-        # Import training modules
-        import subprocess
-        import sys
-        from pathlib import Path
-        
         # Run training script
         result = subprocess.run([
             sys.executable, "src/train.py"
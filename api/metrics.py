@@ -3,13 +3,14 @@ Prometheus metrics collection for the Iris Classification API.
 Tracks API performance, prediction metrics, and system health indicators.
 """
 
+import hashlib
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from prometheus_client import (CONTENT_TYPE_LATEST, Counter, Gauge, Histogram,
-                               Info, generate_latest)
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry,
+                               Counter, Gauge, Histogram, Info, generate_latest)
 
 logger = logging.getLogger(__name__)
 
@@ -20,18 +21,24 @@ class MetricsCollector:
     Tracks predictions, performance, and system health.
     """
 
-    def __init__(self):
+    def __init__(
+        self, cache_ttl_seconds: float = 1.0, registry: CollectorRegistry = REGISTRY
+    ):
+        self.registry = registry
+
         # API request metrics
         self.http_requests_total = Counter(
             "http_requests_total",
             "Total number of HTTP requests",
             ["method", "endpoint", "status_code"],
+            registry=registry,
         )
 
         self.http_request_duration_seconds = Histogram(
             "http_request_duration_seconds",
             "HTTP request duration in seconds",
             ["method", "endpoint"],
+            registry=registry,
         )
 
         # Prediction metrics
@@ -39,6 +46,7 @@ class MetricsCollector:
             "ml_predictions_total",
             "Total number of ML predictions made",
             ["model_version", "prediction_class"],
+            registry=registry,
         )
 
         self.prediction_confidence = Histogram(
@@ -46,6 +54,7 @@ class MetricsCollector:
             "Confidence scores of ML predictions",
             ["model_version", "prediction_class"],
             buckets=[0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0],
+            registry=registry,
         )
 
         self.prediction_duration_seconds = Histogram(
@@ -53,6 +62,14 @@ class MetricsCollector:
             "Time taken to make ML predictions",
             ["model_version"],
             buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+            registry=registry,
+        )
+
+        self.prediction_cache_hits_total = Counter(
+            "ml_prediction_cache_hits_total",
+            "Total number of predictions served from the prediction cache",
+            ["model_version"],
+            registry=registry,
         )
 
         # Batch prediction metrics
@@ -60,6 +77,7 @@ class MetricsCollector:
             "ml_batch_predictions_total",
             "Total number of batch predictions made",
             ["model_version"],
+            registry=registry,
         )
 
         self.batch_size = Histogram(
@@ -67,19 +85,30 @@ class MetricsCollector:
             "Size of batch predictions",
             ["model_version"],
             buckets=[1, 5, 10, 25, 50, 100],
+            registry=registry,
         )
 
         # System metrics
-        self.model_info = Info("ml_model_info", "Information about the loaded ML model")
+        self.model_info = Info(
+            "ml_model_info",
+            "Information about the loaded ML model",
+            registry=registry,
+        )
 
         self.model_load_timestamp = Gauge(
-            "ml_model_load_timestamp_seconds", "Timestamp when the model was loaded"
+            "ml_model_load_timestamp_seconds",
+            "Timestamp when the model was loaded",
+            registry=registry,
         )
 
-        self.api_uptime_seconds = Gauge("api_uptime_seconds", "API uptime in seconds")
+        self.api_uptime_seconds = Gauge(
+            "api_uptime_seconds", "API uptime in seconds", registry=registry
+        )
 
         self.database_connections = Gauge(
-            "database_connections_active", "Number of active database connections"
+            "database_connections_active",
+            "Number of active database connections",
+            registry=registry,
         )
 
         # Error metrics
@@ -87,15 +116,25 @@ class MetricsCollector:
             "ml_prediction_errors_total",
             "Total number of prediction errors",
             ["error_type", "model_version"],
+            registry=registry,
         )
 
         self.api_errors_total = Counter(
-            "api_errors_total", "Total number of API errors", ["endpoint", "error_type"]
+            "api_errors_total",
+            "Total number of API errors",
+            ["endpoint", "error_type"],
+            registry=registry,
         )
 
         # Initialize startup time
         self.startup_time = time.time()
 
+        # Rendered exposition text, reused for scrapes within the TTL
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cached_metrics = None
+        self._cached_etag = None
+        self._cached_at = 0.0
+
     def record_http_request(
         self, method: str, endpoint: str, status_code: int, duration: float
     ):
@@ -109,7 +148,12 @@ class MetricsCollector:
         ).observe(duration)
 
     def record_prediction(
-        self, model_version: str, prediction: str, confidence: float, duration: float
+        self,
+        model_version: str,
+        prediction: str,
+        confidence: float,
+        duration: float,
+        cache_hit: bool = False,
     ):
         """Record single prediction metrics"""
         self.predictions_total.labels(
@@ -120,6 +164,11 @@ class MetricsCollector:
             model_version=model_version, prediction_class=prediction
         ).observe(confidence)
 
+        # Cache hits never reach the model, so keep them out of the duration histogram
+        if cache_hit:
+            self.prediction_cache_hits_total.labels(model_version=model_version).inc()
+            return
+
         self.prediction_duration_seconds.labels(model_version=model_version).observe(
             duration / 1000.0
         )  # Convert ms to seconds
@@ -182,13 +231,28 @@ class MetricsCollector:
         self.database_connections.set(db_connections)
 
     def get_metrics(self) -> str:
-        """Get Prometheus metrics in text format"""
+        """Get Prometheus metrics in text format, cached for cache_ttl_seconds"""
+        now = time.monotonic()
+        if (
+            self._cached_metrics is not None
+            and now - self._cached_at < self.cache_ttl_seconds
+        ):
+            return self._cached_metrics
+
         try:
-            return generate_latest()
+            self._cached_metrics = generate_latest(self.registry)
+            self._cached_etag = f'"{hashlib.sha1(self._cached_metrics).hexdigest()}"'
+            self._cached_at = now
+            return self._cached_metrics
         except Exception as e:
             logger.error(f"Failed to generate metrics: {e}")
+            self._cached_etag = None
             return "# Error generating metrics\n"
 
+    def get_metrics_etag(self) -> Optional[str]:
+        """Get the ETag of the last rendered metrics payload, if any"""
+        return self._cached_etag
+
     def get_content_type(self) -> str:
         """Get the content type for Prometheus metrics"""
         return CONTENT_TYPE_LATEST
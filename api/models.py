@@ -4,7 +4,7 @@ These models ensure type safety and provide automatic validation for API endpoin
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 from pydantic import BaseModel, Field, field_validator
@@ -42,7 +42,15 @@ class PredictionRequest(BaseModel):
     def to_array(self) -> np.ndarray:
         """Convert to numpy array for model prediction"""
         return np.array(
-            [[self.sepal_length, self.sepal_width, self.petal_length, self.petal_width]]
+            [
+                [
+                    self.sepal_length,
+                    self.sepal_width,
+                    self.petal_length,
+                    self.petal_width,
+                ]
+            ],
+            dtype=np.float64,
         )
 
     class Config:
@@ -117,6 +125,23 @@ class BatchPredictionRequest(BaseModel):
             raise ValueError("Batch size cannot exceed 100 samples")
         return v
 
+    def to_array(self) -> np.ndarray:
+        """Convert all samples to one contiguous (n_samples, 4) array"""
+        return np.fromiter(
+            (
+                value
+                for s in self.samples
+                for value in (
+                    s.sepal_length,
+                    s.sepal_width,
+                    s.petal_length,
+                    s.petal_width,
+                )
+            ),
+            dtype=np.float64,
+            count=4 * len(self.samples),
+        ).reshape(-1, 4)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -6,8 +6,9 @@ Handles model loading from local files and MLflow registry with fallback mechani
 import logging
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Tuple
 
 import joblib
 import numpy as np
@@ -26,6 +27,9 @@ from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct single-sample inputs kept in the prediction cache
+PREDICTION_CACHE_SIZE = 1024
+
 
 class PredictionService:
     """
@@ -49,6 +53,9 @@ class PredictionService:
             "petal_width",
         ]
 
+        # LRU cache of (prediction, confidence, probabilities) keyed by features
+        self._prediction_cache: OrderedDict = OrderedDict()
+
         # MLflow client (if available)
         self.mlflow_client = None
         if MLFLOW_AVAILABLE and self.settings.use_mlflow_registry:
@@ -68,6 +75,9 @@ class PredictionService:
         2. MLflow Model Registry (Latest version)
         3. Local model file
         """
+        # Cached predictions belong to the previous model
+        self._prediction_cache.clear()
+
         try:
             # Try MLflow Model Registry first
             if self.mlflow_client and self.settings.use_mlflow_registry:
@@ -193,46 +203,36 @@ class PredictionService:
         if not self.is_model_loaded():
             raise RuntimeError("Model not loaded. Please load model first.")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Preprocess features if scaler is available
-            if self.scaler is not None:
-                features_scaled = self.scaler.transform(features)
+            # Identical repeated inputs are served from the cache without
+            # touching the model; the key is the exact feature bytes
+            cache_key = np.ascontiguousarray(features, dtype=np.float64).tobytes()
+            cached = self._prediction_cache.get(cache_key)
+            cache_hit = cached is not None
+
+            if cache_hit:
+                self._prediction_cache.move_to_end(cache_key)
+                prediction, confidence, prob_dict = cached
             else:
-                features_scaled = features
-                logger.warning("No scaler available, using raw features")
-
-            # Make prediction
-            prediction = self.model.predict(features_scaled)[0]
-
-            # Get prediction probabilities
-            if hasattr(self.model, "predict_proba"):
-                probabilities = self.model.predict_proba(features_scaled)[0]
-                prob_dict = {
-                    class_name: float(prob)
-                    for class_name, prob in zip(self.class_names, probabilities)
-                }
-                confidence = float(max(probabilities))
-            else:
-                # For models without predict_proba, use binary confidence
-                prob_dict = {
-                    class_name: 1.0 if class_name == prediction else 0.0
-                    for class_name in self.class_names
-                }
-                confidence = 1.0
+                prediction, confidence, prob_dict = self._predict_single(features)
+                self._prediction_cache[cache_key] = (prediction, confidence, prob_dict)
+                if len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                    self._prediction_cache.popitem(last=False)
 
             processing_time = (
-                time.time() - start_time
+                time.perf_counter() - start_time
             ) * 1000  # Convert to milliseconds
 
             result = {
                 "prediction": prediction,
                 "confidence": confidence,
-                "probabilities": prob_dict,
+                "probabilities": dict(prob_dict),
                 "model_version": self.model_version,
                 "processing_time_ms": processing_time,
                 "timestamp": datetime.now(),
+                "cache_hit": cache_hit,
             }
 
             logger.debug(
@@ -244,6 +244,41 @@ class PredictionService:
             logger.error(f"Prediction failed: {e}")
             raise RuntimeError(f"Prediction failed: {str(e)}")
 
+    def _predict_single(
+        self, features: np.ndarray
+    ) -> Tuple[Any, float, Dict[str, float]]:
+        """
+        Run the model on one sample.
+        Returns (prediction, confidence, probabilities).
+        """
+        # Preprocess features if scaler is available
+        if self.scaler is not None:
+            features_scaled = self.scaler.transform(features)
+        else:
+            features_scaled = features
+            logger.warning("No scaler available, using raw features")
+
+        # Make prediction
+        prediction = self.model.predict(features_scaled)[0]
+
+        # Get prediction probabilities
+        if hasattr(self.model, "predict_proba"):
+            probabilities = self.model.predict_proba(features_scaled)[0]
+            prob_dict = {
+                class_name: float(prob)
+                for class_name, prob in zip(self.class_names, probabilities)
+            }
+            confidence = float(max(probabilities))
+        else:
+            # For models without predict_proba, use binary confidence
+            prob_dict = {
+                class_name: 1.0 if class_name == prediction else 0.0
+                for class_name in self.class_names
+            }
+            confidence = 1.0
+
+        return prediction, confidence, prob_dict
+
     async def predict_batch(self, features_batch: np.ndarray) -> Dict[str, Any]:
         """
         Make batch predictions on multiple samples.
@@ -251,7 +286,7 @@ class PredictionService:
         if not self.is_model_loaded():
             raise RuntimeError("Model not loaded. Please load model first.")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Preprocess features if scaler is available
@@ -297,7 +332,7 @@ class PredictionService:
                     }
                 )
 
-            total_processing_time = (time.time() - start_time) * 1000
+            total_processing_time = (time.perf_counter() - start_time) * 1000
 
             return {
                 "predictions": results,
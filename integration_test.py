@@ -8,10 +8,66 @@ import os
 import sys
 import time
 import requests
+import shlex
+import shutil
+import socket
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Set IRIS_API_IMAGE to test an image built elsewhere (e.g. CI) instead of building one
+PREBUILT_IMAGE = os.environ.get("IRIS_API_IMAGE")
+DOCKER_IMAGE = PREBUILT_IMAGE or "iris-api-test"
+# Shell-quoted form for the docker commands run through run_command (shell=True)
+DOCKER_IMAGE_ARG = shlex.quote(DOCKER_IMAGE)
+HAS_DOCKER = shutil.which("docker") is not None
+
+# Request payloads, serialized once and reused by the API checks
+IRIS_SAMPLE = {
+    "sepal_length": 5.1,
+    "sepal_width": 3.5,
+    "petal_length": 1.4,
+    "petal_width": 0.2
+}
+BATCH_SAMPLES = {
+    "samples": [
+        {"sepal_length": 5.1, "sepal_width": 3.5, "petal_length": 1.4, "petal_width": 0.2},
+        {"sepal_length": 6.2, "sepal_width": 2.9, "petal_length": 4.3, "petal_width": 1.3},
+        {"sepal_length": 6.5, "sepal_width": 3.0, "petal_length": 5.2, "petal_width": 2.0}
+    ]
+}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# (connect, read) seconds; the server is local, so anything slower is a failure
+REQUEST_TIMEOUT = (0.5, 2.0)
+
+
+def dump_json(payload):
+    """Serialize a payload to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def load_json(content):
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+IRIS_SAMPLE_JSON = dump_json(IRIS_SAMPLE)
+BATCH_JSON = dump_json(BATCH_SAMPLES)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -55,6 +111,20 @@ def run_command(command, cwd=None, timeout=60):
         return False, "", "Command timed out"
 
 
+def wait_for_server(process, host="localhost", port=8000, timeout=30):
+    """Poll until the server accepts connections; False if it exits or times out"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
 def test_environment_setup():
     """Test environment and dependencies"""
     print_status("Testing environment setup...")
@@ -153,41 +223,56 @@ def test_api_functionality():
         "--host", "0.0.0.0", "--port", "8000"
     ])
     
-    # Wait for server to start
-    time.sleep(15)
+    # Reuse one keep-alive connection for all endpoint checks
+    session = requests.Session()
     
     try:
+        # Wait until the server accepts connections rather than a fixed sleep
+        if not wait_for_server(api_process):
+            print_error("API server failed to start")
+            return False
+        
         base_url = "http://localhost:8000"
         
+        # Independent endpoints are requested concurrently, then checked in order
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            health_future = executor.submit(
+                session.get, f"{base_url}/health", timeout=REQUEST_TIMEOUT
+            )
+            model_info_future = executor.submit(
+                session.get, f"{base_url}/model/info", timeout=REQUEST_TIMEOUT
+            )
+            predict_future = executor.submit(
+                session.post, f"{base_url}/predict",
+                data=IRIS_SAMPLE_JSON, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT
+            )
+            batch_future = executor.submit(
+                session.post, f"{base_url}/predict/batch",
+                data=BATCH_JSON, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT
+            )
+        
         # Test health endpoint
-        response = requests.get(f"{base_url}/health", timeout=10)
+        response = health_future.result()
         if response.status_code == 200:
-            health_data = response.json()
+            health_data = load_json(response.content)
             print_success(f"Health check passed: {health_data.get('status', 'unknown')} ✓")
         else:
             print_error(f"Health check failed: {response.status_code}")
             return False
         
         # Test model info endpoint
-        response = requests.get(f"{base_url}/model/info", timeout=10)
+        response = model_info_future.result()
         if response.status_code == 200:
-            model_info = response.json()
+            model_info = load_json(response.content)
             print_success(f"Model info: {model_info.get('model_name', 'unknown')} ✓")
         else:
             print_error(f"Model info failed: {response.status_code}")
             return False
         
         # Test single prediction
-        prediction_data = {
-            "sepal_length": 5.1,
-            "sepal_width": 3.5,
-            "petal_length": 1.4,
-            "petal_width": 0.2
-        }
-        
-        response = requests.post(f"{base_url}/predict", json=prediction_data, timeout=10)
+        response = predict_future.result()
         if response.status_code == 200:
-            result = response.json()
+            result = load_json(response.content)
             print_success(f"Single prediction: {result.get('prediction', 'unknown')} "
                          f"({result.get('confidence', 0):.2%} confidence) ✓")
         else:
@@ -195,24 +280,16 @@ def test_api_functionality():
             return False
         
         # Test batch prediction
-        batch_data = {
-            "samples": [
-                {"sepal_length": 5.1, "sepal_width": 3.5, "petal_length": 1.4, "petal_width": 0.2},
-                {"sepal_length": 6.2, "sepal_width": 2.9, "petal_length": 4.3, "petal_width": 1.3},
-                {"sepal_length": 6.5, "sepal_width": 3.0, "petal_length": 5.2, "petal_width": 2.0}
-            ]
-        }
-        
-        response = requests.post(f"{base_url}/predict/batch", json=batch_data, timeout=10)
+        response = batch_future.result()
         if response.status_code == 200:
-            result = response.json()
+            result = load_json(response.content)
             print_success(f"Batch prediction: {result.get('batch_size', 0)} samples processed ✓")
         else:
             print_error(f"Batch prediction failed: {response.status_code}")
             return False
         
         # Test metrics endpoint
-        response = requests.get(f"{base_url}/metrics", timeout=10)
+        response = session.get(f"{base_url}/metrics", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             print_success("Prometheus metrics endpoint working ✓")
         else:
@@ -227,6 +304,8 @@ def test_api_functionality():
         return False
     
     finally:
+        session.close()
+        
         # Stop API server
         api_process.terminate()
         api_process.wait()
@@ -236,19 +315,32 @@ def test_docker_build():
     """Test Docker image building"""
     print_status("Testing Docker build...")
     
-    # Build Docker image
-    success, stdout, stderr = run_command("docker build -t iris-api-test .", timeout=300)
-    
-    if not success:
-        print_error(f"Docker build failed: {stderr}")
+    if not HAS_DOCKER:
+        print_error("Docker build failed: docker CLI not found on PATH")
         return False
     
-    print_success("Docker image built successfully ✓")
+    # Only an explicitly named image is reused; otherwise build from the current tree
+    if PREBUILT_IMAGE:
+        success, _, stderr = run_command(f"docker image inspect {DOCKER_IMAGE_ARG}", timeout=30)
+        
+        if not success:
+            print_error(f"Prebuilt Docker image {DOCKER_IMAGE} not found: {stderr}")
+            return False
+        
+        print_success(f"Using prebuilt Docker image {DOCKER_IMAGE} ✓")
+    else:
+        success, stdout, stderr = run_command(f"docker build -t {DOCKER_IMAGE_ARG} .", timeout=300)
+        
+        if not success:
+            print_error(f"Docker build failed: {stderr}")
+            return False
+        
+        print_success("Docker image built successfully ✓")
     
     # Test Docker run (quick test)
     print_status("Testing Docker container...")
     success, stdout, stderr = run_command(
-        "docker run --rm -d --name iris-test -p 8001:8000 iris-api-test", 
+        f"docker run --rm -d --name iris-test -p 8001:8000 {DOCKER_IMAGE_ARG}", 
         timeout=30
     )
     
@@ -269,12 +361,12 @@ def test_docker_build():
         run_command("docker stop iris-test", timeout=10)
     else:
         print_error(f"Docker run failed: {stderr}")
-        return False
     
-    # Clean up
-    run_command("docker rmi iris-api-test", timeout=30)
+    # Clean up (leave prebuilt images for whoever built them)
+    if not PREBUILT_IMAGE:
+        run_command(f"docker rmi {DOCKER_IMAGE_ARG}", timeout=30)
     
-    return True
+    return success
 
 
 def test_dvc_pipeline():
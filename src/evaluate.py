@@ -15,13 +15,18 @@ from sklearn.preprocessing import label_binarize
 from sklearn.model_selection import cross_val_score
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from preprocess import load_data, preprocess_data
 
 
 def load_params():
     """Load parameters from params.yaml"""
     with open('params.yaml', 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def evaluate_model(model, X_test, y_test, class_names):
@@ -2,11 +2,14 @@
 """Simple test script to verify the MLOps pipeline works end-to-end."""
 
 import requests
-import time
 import subprocess
 import sys
 import os
 
+# Shared with integration_test.py so the two scripts cannot drift apart
+from integration_test import (IRIS_SAMPLE_JSON, JSON_HEADERS, REQUEST_TIMEOUT,
+                              wait_for_server)
+
 
 def test_training():
     """Test model training"""
@@ -40,27 +43,29 @@ def test_api():
         "--host", "0.0.0.0", "--port", "8000"
     ])
     
-    # Wait for server to start
-    time.sleep(10)
+    # Reuse one keep-alive connection for all endpoint checks
+    session = requests.Session()
     
     try:
+        # Wait until the server accepts connections rather than a fixed sleep
+        if not wait_for_server(api_process):
+            print("❌ API server failed to start")
+            return False
+        
         base_url = "http://localhost:8000"
         
         # Test health endpoint
-        response = requests.get(f"{base_url}/health", timeout=10)
+        response = session.get(f"{base_url}/health", timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             print(f"❌ Health check failed: {response.status_code}")
             return False
         print("✅ Health check passed")
         
         # Test prediction endpoint
-        prediction_data = {
-            "sepal_length": 5.1,
-            "sepal_width": 3.5,
-            "petal_length": 1.4,
-            "petal_width": 0.2
-        }
-        response = requests.post(f"{base_url}/predict", json=prediction_data, timeout=10)
+        response = session.post(
+            f"{base_url}/predict", data=IRIS_SAMPLE_JSON, headers=JSON_HEADERS,
+            timeout=REQUEST_TIMEOUT
+        )
         if response.status_code != 200:
             print(f"❌ Prediction failed: {response.status_code}")
             return False
@@ -73,7 +78,7 @@ def test_api():
         print(f"✅ Prediction successful: {result['prediction']}")
         
         # Test metrics endpoint
-        response = requests.get(f"{base_url}/metrics", timeout=10)
+        response = session.get(f"{base_url}/metrics", timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             print(f"❌ Metrics endpoint failed: {response.status_code}")
             return False
@@ -86,6 +91,8 @@ def test_api():
         return False
     
     finally:
+        session.close()
+        
         # Stop API server
         api_process.terminate()
         api_process.wait()
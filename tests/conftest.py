@@ -1,14 +1,64 @@
 """Basic pytest configuration."""
 
+from types import MappingProxyType
+
+import httpx
 import pytest
+import pytest_asyncio
+
+from api.config import get_settings
+from api.main import app
+from api.models import PredictionRequest
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session-wide event loop"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """In-process ASGI client shared per module so the app lifespan runs only once"""
+    # Keep prediction logs in memory instead of writing ./logs.db
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", "sqlite:///:memory:")
+        get_settings.cache_clear()
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://testserver"
+            ) as test_client:
+                yield test_client
+    get_settings.cache_clear()
+
+
+# Setosa sample shared by the fixtures below (read-only)
+SAMPLE_FEATURES = MappingProxyType({
+    "sepal_length": 5.1,
+    "sepal_width": 3.5,
+    "petal_length": 1.4,
+    "petal_width": 0.2
+})
 
 
 @pytest.fixture
 def sample_prediction_request():
     """Sample prediction request data"""
-    return {
-        "sepal_length": 5.1,
-        "sepal_width": 3.5,
-        "petal_length": 1.4,
-        "petal_width": 0.2
-    }
\ No newline at end of file
+    return dict(SAMPLE_FEATURES)
+
+
+@pytest.fixture(scope="session")
+def setosa_request():
+    """Validated PredictionRequest built once per session"""
+    return PredictionRequest(**SAMPLE_FEATURES)
+
+
+@pytest.fixture(scope="session")
+def setosa_array(setosa_request):
+    """Read-only (1, 4) feature array for the sample request"""
+    array = setosa_request.to_array()
+    array.flags.writeable = False
+    return array
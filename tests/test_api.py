@@ -1,68 +1,112 @@
 """Basic tests for the FastAPI endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
-from api.main import app
+from api.logging_service import LoggingService
+from api.metrics import MetricsCollector
+from api.prediction_service import PredictionService
 
+# Canned service responses returned by the mocked prediction service (read-only)
+_MODEL_INFO = MappingProxyType({
+    "model_name": "iris-classifier",
+    "model_type": "LogisticRegression",
+    "model_version": "retrained-1.0.0"
+})
 
-def test_root_endpoint():
+
+@pytest.fixture
+def services(monkeypatch):
+    """Replace the app's global services with mocks (async methods become AsyncMocks)"""
+    pred = MagicMock(spec=PredictionService)
+    log = MagicMock(spec=LoggingService)
+    met = MagicMock(spec=MetricsCollector)
+    monkeypatch.setattr("api.main.prediction_service", pred)
+    monkeypatch.setattr("api.main.logging_service", log)
+    monkeypatch.setattr("api.main.metrics_collector", met)
+    return pred, log, met
+
+
+async def test_root_endpoint(client):
     """Test the root endpoint"""
-    with TestClient(app) as client:
-        response = client.get("/")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == "Iris Classification API"
+    response = await client.get("/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["message"] == "Iris Classification API"
 
 
-@patch('api.main.prediction_service')
-@patch('api.main.logging_service')
-def test_health_endpoint(mock_logging_service, mock_prediction_service):
+async def test_health_endpoint(services, client):
     """Test health endpoint"""
-    mock_prediction_service.is_model_loaded.return_value = True
-    mock_logging_service.is_healthy.return_value = True
+    pred, log, _ = services
+    pred.is_model_loaded.return_value = True
+    log.is_healthy.return_value = True
     
-    with TestClient(app) as client:
-        response = client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
+    response = await client.get("/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert "status" in data
 
 
 
-def test_predict_invalid_input():
+async def test_predict_invalid_input(client):
     """Test prediction with invalid input"""
-    with TestClient(app) as client:
-        response = client.post("/predict", json={
-            "sepal_length": -1.0,  # Invalid
-            "sepal_width": 3.5,
-            "petal_length": 1.4,
-            "petal_width": 0.2
-        })
-        assert response.status_code == 422
-
-
-@patch('api.main.prediction_service')
-@patch('api.main.logging_service')
-@patch('api.main.metrics_collector')
-@patch('subprocess.run')
-def test_retrain_endpoint(mock_subprocess, mock_metrics, mock_logging_service, mock_prediction_service):
+    response = await client.post("/predict", json={
+        "sepal_length": -1.0,  # Invalid
+        "sepal_width": 3.5,
+        "petal_length": 1.4,
+        "petal_width": 0.2
+    })
+    assert response.status_code == 422
+
+
+async def test_retrain_endpoint(services, client, monkeypatch):
     """Test retrain endpoint"""
+    pred, _, _ = services
+    
     # Mock successful training
+    mock_subprocess = MagicMock()
     mock_subprocess.return_value.returncode = 0
     mock_subprocess.return_value.stderr = ""
+    monkeypatch.setattr("subprocess.run", mock_subprocess)
     
-    mock_prediction_service.load_model.return_value = None
-    mock_prediction_service.get_model_info.return_value = {
-        "model_name": "iris-classifier",
-        "model_type": "LogisticRegression",
-        "model_version": "retrained-1.0.0"
-    }
+    pred.load_model.return_value = True
+    pred.get_model_info.return_value = _MODEL_INFO
     
-    with TestClient(app) as client:
-        response = client.post("/retrain")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert "timestamp" in data
\ No newline at end of file
+    response = await client.post("/retrain")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert "timestamp" in data
+    assert data["model_info"] == dict(_MODEL_INFO)
+
+
+@pytest.fixture
+def pinned_metrics_cache(monkeypatch):
+    """Keep the rendered metrics (and their ETag) cached for the whole test"""
+    monkeypatch.setattr("api.main.metrics_collector.cache_ttl_seconds", 3600)
+
+
+async def test_metrics_not_modified(client, pinned_metrics_cache):
+    """Test metrics endpoint answers a matching If-None-Match with 304"""
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get("/metrics", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+async def test_metrics_not_modified_header_forms(client, pinned_metrics_cache):
+    """Test weak, listed and wildcard If-None-Match values also yield 304"""
+    etag = (await client.get("/metrics")).headers["etag"]
+
+    for if_none_match in (f"W/{etag}", f'"stale", {etag}', "*"):
+        response = await client.get(
+            "/metrics", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304, if_none_match
+
+    response = await client.get("/metrics", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
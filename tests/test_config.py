@@ -0,0 +1,19 @@
+"""Basic tests for application settings."""
+
+from api.config import get_settings
+
+
+def test_get_settings_cached():
+    """Test settings are built once and reused"""
+    get_settings.cache_clear()
+    assert get_settings() is get_settings()
+
+
+def test_get_settings_env_override(monkeypatch):
+    """Test env overrides apply after clearing the cache"""
+    monkeypatch.setenv("MODEL_PATH", "custom/model.pkl")
+    get_settings.cache_clear()
+    try:
+        assert get_settings().model_path == "custom/model.pkl"
+    finally:
+        get_settings.cache_clear()
\ No newline at end of file
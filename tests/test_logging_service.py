@@ -0,0 +1,107 @@
+"""Basic tests for LoggingService."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from api.config import Settings
+from api.logging_service import LoggingService
+
+REQUEST_DATA = {
+    "sepal_length": 5.1,
+    "sepal_width": 3.5,
+    "petal_length": 1.4,
+    "petal_width": 0.2
+}
+
+
+def make_result(prediction="setosa", confidence=0.95):
+    """Build a prediction result as returned by PredictionService"""
+    return {
+        "prediction": prediction,
+        "confidence": confidence,
+        "probabilities": {"setosa": confidence, "versicolor": 1 - confidence, "virginica": 0.0},
+        "model_version": "test-1.0.0",
+        "processing_time_ms": 1.5
+    }
+
+
+@pytest_asyncio.fixture(scope="session")
+async def logging_service():
+    """LoggingService on an in-memory database, initialized once per session"""
+    settings = Settings(database_url="sqlite:///:memory:", log_predictions=True)
+    service = LoggingService(settings)
+    await service.initialize_database()
+    yield service
+    await service.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_tables(logging_service):
+    """Empty the log tables before each test instead of rebuilding the schema"""
+    async with logging_service._lock:
+        logging_service.connection.executescript(
+            "DELETE FROM prediction_logs; DELETE FROM system_events; DELETE FROM api_metrics;"
+        )
+
+
+async def test_is_healthy(logging_service):
+    """Test an initialized service reports healthy"""
+    assert await logging_service.is_healthy() is True
+
+
+async def test_log_prediction(logging_service):
+    """Test a single prediction is stored"""
+    await logging_service.log_prediction(REQUEST_DATA, make_result())
+
+    assert await logging_service.count("prediction_logs") == 1
+
+
+async def test_log_batch_prediction(logging_service):
+    """Test each prediction in a batch is stored"""
+    batch_result = {
+        "predictions": [make_result(), make_result("versicolor", 0.8)],
+        "batch_size": 2,
+        "total_processing_time_ms": 3.0
+    }
+    await logging_service.log_batch_prediction([REQUEST_DATA, REQUEST_DATA], batch_result)
+
+    assert await logging_service.count("prediction_logs") == 2
+
+
+async def test_count_rejects_unknown_table(logging_service):
+    """Test count only accepts the service's own tables"""
+    with pytest.raises(ValueError):
+        await logging_service.count("sqlite_master")
+
+
+async def test_get_prediction_stats_empty(logging_service):
+    """Test stats on an empty log"""
+    stats = await logging_service.get_prediction_stats(24)
+    assert stats["total_predictions"] == 0
+
+
+async def test_get_prediction_stats_with_data(logging_service):
+    """Test stats aggregate predictions logged concurrently"""
+    results = [make_result()] * 3 + [make_result("versicolor", 0.8)]
+    await asyncio.gather(*(logging_service.log_prediction(REQUEST_DATA, r) for r in results))
+
+    stats = await logging_service.get_prediction_stats(24)
+    assert stats["total_predictions"] == 4
+    assert stats["prediction_distribution"] == {"setosa": 3, "versicolor": 1}
+
+
+async def test_get_recent_predictions(logging_service):
+    """Test recent predictions honour the limit"""
+    classes = ["setosa", "versicolor", "virginica"]
+    batch_result = {
+        "predictions": [make_result(classes[i % 3]) for i in range(5)],
+        "batch_size": 5,
+        "total_processing_time_ms": 7.5
+    }
+    await logging_service.log_batch_prediction([REQUEST_DATA] * 5, batch_result)
+
+    recent = await logging_service.get_recent_predictions(limit=3)
+    assert len(recent) == 3
+    assert all(row["prediction"] in classes for row in recent)
\ No newline at end of file
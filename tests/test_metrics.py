@@ -0,0 +1,56 @@
+"""Basic tests for the Prometheus metrics collector."""
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from api.metrics import MetricsCollector
+
+
+@pytest.fixture(scope="module")
+def collector():
+    """Collector on a private registry, built once per module"""
+    return MetricsCollector(registry=CollectorRegistry())
+
+
+def test_record_prediction(collector):
+    """Test single predictions are counted per class"""
+    collector.record_prediction("test-1.0.0", "setosa", 0.95, 12.5)
+    assert collector.registry.get_sample_value(
+        "ml_predictions_total",
+        {"model_version": "test-1.0.0", "prediction_class": "setosa"},
+    ) == 1.0
+
+
+def test_record_prediction_cache_hit(collector):
+    """Test cache hits are counted without observing a prediction duration"""
+    labels = {"model_version": "cache-1.0.0"}
+    collector.record_prediction("cache-1.0.0", "setosa", 0.95, 0.01, cache_hit=True)
+    assert collector.registry.get_sample_value(
+        "ml_prediction_cache_hits_total", labels
+    ) == 1.0
+    assert collector.registry.get_sample_value(
+        "ml_prediction_duration_seconds_count", labels
+    ) is None
+
+
+def test_record_batch_prediction(collector):
+    """Test batch predictions are counted per model version"""
+    collector.record_batch_prediction("test-1.0.0", batch_size=4, duration=20.0)
+    assert collector.registry.get_sample_value(
+        "ml_batch_predictions_total", {"model_version": "test-1.0.0"}
+    ) == 1.0
+
+
+def test_get_metrics_cached_within_ttl(collector):
+    """Test repeated scrapes within the TTL reuse the rendered output"""
+    first = collector.get_metrics()
+    collector.record_api_error("/test", "cache_test")
+    assert collector.get_metrics() is first
+
+
+def test_get_metrics_regenerated_after_ttl(collector):
+    """Test metrics are re-rendered once the TTL has expired"""
+    collector.get_metrics()
+    collector.record_api_error("/test", "cache_expiry_test")
+    collector._cached_at -= collector.cache_ttl_seconds
+    assert b"cache_expiry_test" in collector.get_metrics()
\ No newline at end of file
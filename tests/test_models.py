@@ -1,20 +1,15 @@
 """Basic tests for Pydantic models."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
-from api.models import PredictionRequest
+from api.models import BatchPredictionRequest, PredictionRequest
 
 
-def test_valid_prediction_request():
+def test_valid_prediction_request(setosa_request):
     """Test valid prediction request"""
-    request = PredictionRequest(
-        sepal_length=5.1,
-        sepal_width=3.5,
-        petal_length=1.4,
-        petal_width=0.2
-    )
-    assert request.sepal_length == 5.1
-    assert request.sepal_width == 3.5
+    assert setosa_request.sepal_length == 5.1
+    assert setosa_request.sepal_width == 3.5
 
 
 def test_negative_values_rejected():
@@ -28,14 +23,27 @@ def test_negative_values_rejected():
         )
 
 
-def test_to_array_conversion():
+def test_to_array_conversion(setosa_array):
     """Test conversion to numpy array"""
-    request = PredictionRequest(
-        sepal_length=5.1,
-        sepal_width=3.5,
-        petal_length=1.4,
-        petal_width=0.2
-    )
-    array = request.to_array()
-    assert array.shape == (1, 4)
-    assert array[0, 0] == 5.1
\ No newline at end of file
+    assert setosa_array.shape == (1, 4)
+    assert setosa_array.dtype == np.float64
+    assert setosa_array[0, 0] == 5.1
+
+
+def test_batch_to_array_contiguous(sample_prediction_request):
+    """Test batch conversion builds one contiguous feature matrix"""
+    batch = BatchPredictionRequest(samples=[
+        sample_prediction_request,
+        {"sepal_length": 6.2, "sepal_width": 2.9, "petal_length": 4.3, "petal_width": 1.3}
+    ])
+    array = batch.to_array()
+    assert array.shape == (2, 4)
+    assert array.flags["C_CONTIGUOUS"]
+    assert array.dtype == np.float64
+    assert array[1, 2] == 4.3
+
+
+def test_too_large_batch_rejected(setosa_request):
+    """Test batches over 100 samples are rejected"""
+    with pytest.raises(ValidationError):
+        BatchPredictionRequest(samples=(setosa_request for _ in range(101)))
\ No newline at end of file
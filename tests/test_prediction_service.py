@@ -1,21 +1,105 @@
 """Basic tests for PredictionService."""
 
+import joblib
 import pytest
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+from api.config import Settings
 from api.prediction_service import PredictionService
 
 
+# Plain attribute bag standing in for Settings where no files are loaded
+STUB_SETTINGS = SimpleNamespace(
+    model_path="",
+    scaler_path="",
+    use_mlflow_registry=False,
+    mlflow_tracking_uri="",
+    mlflow_model_name="iris-classifier",
+)
+
+
+class FakeModel:
+    """Picklable stand-in for a fitted classifier, so no sklearn training runs"""
+
+    classes_ = np.array(["setosa", "versicolor", "virginica"])
+
+    def predict(self, X):
+        return np.repeat(self.classes_[:1], len(X))
+
+    def predict_proba(self, X):
+        return np.tile([0.9, 0.05, 0.05], (len(X), 1))
+
+
+@pytest.fixture(scope="session")
+def model_settings(tmp_path_factory):
+    """Settings pointing at a fake model dumped once per session"""
+    model_dir = tmp_path_factory.mktemp("model")
+    joblib.dump(FakeModel(), model_dir / "model.pkl")
+    return Settings(
+        model_path=str(model_dir / "model.pkl"),
+        scaler_path=str(model_dir / "missing_scaler.pkl"),
+    )
+
+
 def test_prediction_service_initialization():
     """Test PredictionService initialization"""
-    mock_settings = MagicMock()
-    service = PredictionService(mock_settings)
+    service = PredictionService(STUB_SETTINGS)
     assert service is not None
 
 
 def test_is_model_loaded_false_initially():
     """Test model loaded status is false initially"""
-    mock_settings = MagicMock()
-    service = PredictionService(mock_settings)
-    assert service.is_model_loaded() is False
\ No newline at end of file
+    service = PredictionService(STUB_SETTINGS)
+    assert service.is_model_loaded() is False
+
+
+async def test_predict_cache_hit_skips_model(setosa_array):
+    """Test repeated identical inputs are served from the prediction cache"""
+    service = PredictionService(STUB_SETTINGS)
+    service.model = MagicMock()
+    service.model.predict.return_value = np.array(["setosa"])
+    service.model.predict_proba.return_value = np.array([[0.9, 0.05, 0.05]])
+    service.model_loaded = True
+
+    first = await service.predict(setosa_array)
+    second = await service.predict(setosa_array)
+
+    assert service.model.predict.call_count == 1
+    assert second["prediction"] == first["prediction"] == "setosa"
+    assert second["probabilities"] == first["probabilities"]
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True
+
+
+async def test_predict_cache_keys_on_exact_features():
+    """Test inputs differing past the 3rd decimal are not served from the cache"""
+    service = PredictionService(STUB_SETTINGS)
+    service.model = MagicMock()
+    service.model.predict.return_value = np.array(["virginica"])
+    service.model.predict_proba.return_value = np.array([[0.0, 0.49, 0.51]])
+    service.model_loaded = True
+
+    await service.predict(np.array([[6.0, 2.7, 4.9504, 1.6]]))
+    await service.predict(np.array([[6.0, 2.7, 4.9496, 1.6]]))
+
+    assert service.model.predict.call_count == 2
+
+
+async def test_load_model_from_local_files(model_settings):
+    """Test the model is loaded from the local artifact"""
+    service = PredictionService(model_settings)
+    assert await service.load_model() is True
+    assert service.is_model_loaded() is True
+    assert service.model_type == "FakeModel"
+
+
+async def test_predict_batch_with_loaded_model(model_settings):
+    """Test batch predictions from a loaded model"""
+    service = PredictionService(model_settings)
+    await service.load_model()
+
+    result = await service.predict_batch(np.array([[5.1, 3.5, 1.4, 0.2], [6.2, 2.9, 4.3, 1.3]]))
+    assert result["batch_size"] == 2
+    assert [p["prediction"] for p in result["predictions"]] == ["setosa", "setosa"]
\ No newline at end of file